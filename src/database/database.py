@@ -1,7 +1,9 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, scoped_session
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
 import os
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -12,12 +14,77 @@ DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://localhost/file_segmentati
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
+# Connection pool configuration. The read engine serves the polled read
+# endpoints; the write engine only backs the occasional /process upload, so
+# a long upload can't starve the reads of connections.
+# Defaults keep 2 web workers within the 20 connections of essential-0:
+# 2 * ((3 + 2) + (1 + 1)) = 14, leaving headroom for one-off dynos. An upload
+# holds a write connection until it finishes, so each worker processes at most
+# DB_WRITE_POOL_SIZE + DB_WRITE_MAX_OVERFLOW uploads at once; further uploads
+# wait up to DB_POOL_TIMEOUT for a connection and then fail.
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '3'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '2'))
+DB_WRITE_POOL_SIZE = int(os.getenv('DB_WRITE_POOL_SIZE', '1'))
+DB_WRITE_MAX_OVERFLOW = int(os.getenv('DB_WRITE_MAX_OVERFLOW', '1'))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))  # seconds to wait for a connection
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))  # seconds, -1 disables
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'True').lower() == 'true'
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv('DB_STATEMENT_TIMEOUT_MS', '30000'))  # 0 disables
+
+
+def _connect_args(url) -> dict:
+    """Build psycopg2 connect args, keeping any `options` from the URL."""
+    if DB_STATEMENT_TIMEOUT_MS <= 0:
+        return {}
+    # connect_args replace the URL's `options`, so carry them over; settings
+    # later in the string win, letting the URL override the default timeout
+    options = f'-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}'
+    if url.query.get('options'):
+        options = f"{options} {url.query['options']}"
+    return {'options': options}
+
+
+def _engine_options(
+    database_url: str,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None
+) -> dict:
+    """Build pool and connection options for an engine (read pool sizes by default)."""
+    url = make_url(database_url)
+    if url.get_backend_name() == 'sqlite':
+        # SQLite has no server-side pool or statement timeout to tune
+        return {}
+
+    options = {
+        'pool_size': DB_POOL_SIZE if pool_size is None else pool_size,
+        'max_overflow': DB_MAX_OVERFLOW if max_overflow is None else max_overflow,
+        'pool_timeout': DB_POOL_TIMEOUT,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'pool_pre_ping': DB_POOL_PRE_PING,
+    }
+    connect_args = _connect_args(url)
+    if connect_args:
+        options['connect_args'] = connect_args
+    return options
+
+
 class DatabaseHandler:
-    def __init__(self):
-        self.engine = create_engine(DATABASE_URL)
+    def __init__(self, database_url: str = DATABASE_URL):
+        self.engine = create_engine(
+            database_url,
+            **_engine_options(
+                database_url,
+                pool_size=DB_WRITE_POOL_SIZE,
+                max_overflow=DB_WRITE_MAX_OVERFLOW
+            )
+        )
         self.SessionFactory = sessionmaker(bind=self.engine)
         self.Session = scoped_session(self.SessionFactory)
-    
+
+        # Separate pool for the read endpoints, which FastAPI runs in its threadpool
+        self.read_engine = create_engine(database_url, **_engine_options(database_url))
+        self.ReadSessionFactory = sessionmaker(bind=self.read_engine)
+
     @contextmanager
     def session_scope(self):
         """Provide a transactional scope around a series of operations."""
@@ -30,11 +97,26 @@ class DatabaseHandler:
             raise e
         finally:
             session.close()
-    
+
+    @contextmanager
+    def read_session_scope(self):
+        """Provide a session from the read pool for read-only operations."""
+        with self.ReadSessionFactory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def lifespan(self, app):
+        """FastAPI lifespan: release both pools on shutdown."""
+        try:
+            yield
+        finally:
+            self.dispose()
+
     def get_session(self):
         """Get a new session."""
         return self.Session()
-    
+
     def dispose(self):
-        """Dispose of the engine."""
-        self.engine.dispose()
\ No newline at end of file
+        """Dispose of the engines."""
+        self.engine.dispose()
+        self.read_engine.dispose()
@@ -1,6 +1,7 @@
 import pandas as pd
 import json
 from typing import Dict, Any, List, Optional
+from sqlalchemy import select, func
 from sqlalchemy.orm import Session
 from datetime import datetime
 from ..database.models import FileProcess, Segment, Record, Donor  # Added Donor
@@ -97,6 +98,79 @@ class SegmentationProcessor:
                 } for val, seg in value_to_segment.items()]
             }
 
+    def get_segment_stats(self, process_uuid: str) -> Dict[str, Any]:
+        """
+        Get statistics for all segments in a file process.
+        """
+        with self.db_handler.read_session_scope() as session:
+            file_process = session.scalar(
+                select(FileProcess).where(FileProcess.process_uuid == process_uuid)
+            )
+            if file_process is None:
+                raise ValueError(f"File process {process_uuid} not found")
+
+            segments = session.scalars(
+                select(Segment)
+                .where(Segment.file_process_id == file_process.id)
+                .order_by(Segment.segment_number)
+            )
+
+            return {
+                "process_uuid": file_process.process_uuid,
+                "filename": file_process.filename,
+                "total_segments": file_process.total_segments,
+                "total_records": file_process.total_records,
+                "created_at": file_process.created_at.isoformat() if file_process.created_at else None,
+                "segments": [{
+                    "segment_uuid": seg.segment_uuid,
+                    "segment_number": seg.segment_number,
+                    "record_count": seg.record_count
+                } for seg in segments]
+            }
+
+    def get_segment_records(
+        self,
+        segment_uuid: str,
+        page: int = 1,
+        per_page: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Get a page of records for a segment, ordered by sequence number.
+        """
+        page = max(page, 1)
+        per_page = max(per_page, 1)
+
+        with self.db_handler.read_session_scope() as session:
+            segment = session.scalar(
+                select(Segment).where(Segment.segment_uuid == segment_uuid)
+            )
+            if segment is None:
+                raise ValueError(f"Segment {segment_uuid} not found")
+
+            total_records = session.scalar(
+                select(func.count(Record.id)).where(Record.segment_id == segment.id)
+            )
+            records = session.scalars(
+                select(Record)
+                .where(Record.segment_id == segment.id)
+                .order_by(Record.sequence_number)
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            )
+
+            return {
+                "segment_uuid": segment.segment_uuid,
+                "segment_number": segment.segment_number,
+                "page": page,
+                "per_page": per_page,
+                "total_records": total_records,
+                "records": [{
+                    "record_uuid": rec.record_uuid,
+                    "sequence_number": rec.sequence_number,
+                    "record_data": rec.record_data
+                } for rec in records]
+            }
+
     def _create_segments(self, session: Session, file_process_id: int, num_segments: int) -> List[Segment]:
         """Create the specified number of segments."""
         segments = [
@@ -0,0 +1,45 @@
+import os
+import tempfile
+
+import pytest
+
+# src.web_app connects at import time; keep tests off any configured database
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+
+from src.database.database import DatabaseHandler  # noqa: E402
+from src.database.models import FileProcess, Segment, Record, init_db  # noqa: E402
+from src.segmentation.core import SegmentationProcessor  # noqa: E402
+
+
+@pytest.fixture
+def processor(tmp_path):
+    db_handler = DatabaseHandler(f"sqlite:///{tmp_path / 'test.db'}")
+    init_db(db_handler.engine)
+    yield SegmentationProcessor(db_handler)
+    db_handler.dispose()
+
+
+@pytest.fixture
+def file_process(processor):
+    """Seed a file process with two segments and five records in the first."""
+    with processor.db_handler.session_scope() as session:
+        file_process = FileProcess(filename="test.csv", total_segments=2, total_records=5)
+        session.add(file_process)
+        session.flush()
+
+        segments = [
+            Segment(segment_number=i, file_process_id=file_process.id, record_count=count)
+            for i, count in enumerate([5, 0])
+        ]
+        session.add_all(segments)
+        session.flush()
+
+        session.add_all([
+            Record(segment_id=segments[0].id, sequence_number=i, record_data={"id": i})
+            for i in range(5)
+        ])
+
+        return {
+            "process_uuid": file_process.process_uuid,
+            "segment_uuids": [seg.segment_uuid for seg in segments],
+        }
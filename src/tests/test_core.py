@@ -0,0 +1,37 @@
+import pytest
+
+
+def test_get_segment_stats(processor, file_process):
+    stats = processor.get_segment_stats(file_process["process_uuid"])
+
+    assert stats["process_uuid"] == file_process["process_uuid"]
+    assert stats["total_records"] == 5
+    assert [seg["segment_uuid"] for seg in stats["segments"]] == file_process["segment_uuids"]
+    assert [seg["record_count"] for seg in stats["segments"]] == [5, 0]
+
+
+def test_get_segment_stats_not_found(processor):
+    with pytest.raises(ValueError):
+        processor.get_segment_stats("missing")
+
+
+def test_get_segment_records_pagination(processor, file_process):
+    segment_uuid = file_process["segment_uuids"][0]
+    records = processor.get_segment_records(segment_uuid, page=2, per_page=2)
+
+    assert records["total_records"] == 5
+    assert records["page"] == 2
+    assert [rec["sequence_number"] for rec in records["records"]] == [2, 3]
+    assert [rec["record_data"] for rec in records["records"]] == [{"id": 2}, {"id": 3}]
+
+
+def test_get_segment_records_last_page(processor, file_process):
+    segment_uuid = file_process["segment_uuids"][0]
+    records = processor.get_segment_records(segment_uuid, page=3, per_page=2)
+
+    assert [rec["sequence_number"] for rec in records["records"]] == [4]
+
+
+def test_get_segment_records_not_found(processor):
+    with pytest.raises(ValueError):
+        processor.get_segment_records("missing")
@@ -0,0 +1,62 @@
+import asyncio
+
+from src.database import database
+from src.database.database import DatabaseHandler, _engine_options
+
+
+def test_engine_options_statement_timeout(monkeypatch):
+    monkeypatch.setattr(database, "DB_STATEMENT_TIMEOUT_MS", 5000)
+    options = _engine_options("postgresql://user@host/db", pool_size=1, max_overflow=2)
+
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+    assert options["pool_size"] == 1
+    assert options["max_overflow"] == 2
+
+
+def test_engine_options_read_pool_defaults(monkeypatch):
+    monkeypatch.setattr(database, "DB_POOL_SIZE", 4)
+    monkeypatch.setattr(database, "DB_MAX_OVERFLOW", 6)
+    options = _engine_options("postgresql://user@host/db")
+
+    assert options["pool_size"] == 4
+    assert options["max_overflow"] == 6
+
+
+def test_engine_options_keeps_url_options(monkeypatch):
+    monkeypatch.setattr(database, "DB_STATEMENT_TIMEOUT_MS", 5000)
+    options = _engine_options("postgresql+psycopg2://u@h/db?options=-c%20search_path%3Dtenant")
+
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000 -c search_path=tenant"}
+
+
+def test_engine_options_statement_timeout_disabled(monkeypatch):
+    monkeypatch.setattr(database, "DB_STATEMENT_TIMEOUT_MS", 0)
+
+    assert "connect_args" not in _engine_options("postgresql://user@host/db")
+
+
+def test_engine_options_sqlite():
+    assert _engine_options("sqlite:///data/test.db") == {}
+
+
+def test_read_and_write_engines_are_separate(tmp_path):
+    db_handler = DatabaseHandler(f"sqlite:///{tmp_path / 'test.db'}")
+
+    assert db_handler.read_engine is not db_handler.engine
+    with db_handler.read_session_scope() as session:
+        assert session.get_bind() is db_handler.read_engine
+
+    db_handler.dispose()
+
+
+def test_lifespan_disposes_engines(tmp_path, monkeypatch):
+    db_handler = DatabaseHandler(f"sqlite:///{tmp_path / 'test.db'}")
+    disposed = []
+    monkeypatch.setattr(db_handler, "dispose", lambda: disposed.append(True))
+
+    async def run():
+        async with db_handler.lifespan(app=None):
+            assert not disposed
+
+    asyncio.run(run())
+    assert disposed
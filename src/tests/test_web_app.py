@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import web_app
+
+
+@pytest.fixture
+def client(monkeypatch, processor):
+    monkeypatch.setattr(web_app, "processor", processor)
+    return TestClient(web_app.app)
+
+
+def test_segment_stats_endpoint(client, file_process):
+    response = client.get(f"/segment/{file_process['process_uuid']}")
+
+    assert response.status_code == 200
+    assert response.json()["total_records"] == 5
+
+
+def test_segment_stats_endpoint_not_found(client):
+    assert client.get("/segment/missing").status_code == 404
+
+
+def test_segment_records_endpoint(client, file_process):
+    segment_uuid = file_process["segment_uuids"][0]
+    response = client.get(f"/segment/{segment_uuid}/records", params={"page": 1, "per_page": 3})
+
+    assert response.status_code == 200
+    assert [rec["sequence_number"] for rec in response.json()["records"]] == [0, 1, 2]
+
+
+def test_segment_records_endpoint_not_found(client):
+    assert client.get("/segment/missing/records").status_code == 404
+
+
+def test_process_runs_off_the_event_loop(client, monkeypatch, processor):
+    def fake_process_file(filepath, num_segments, selected_columns=None):
+        # Raises if called on the event loop thread
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        return {"process_uuid": "test", "total_records": 0, "segments": []}
+
+    monkeypatch.setattr(processor, "process_file", fake_process_file)
+    response = client.post(
+        "/process",
+        files={"file": ("test.csv", b"id\n1\n")},
+        data={"segmentation_method": "equal", "selected_columns": "[]", "num_segments": 2}
+    )
+
+    assert response.status_code == 200
+
+
+def test_segment_stats_runs_off_the_event_loop(client, monkeypatch, processor, file_process):
+    get_segment_stats = processor.get_segment_stats
+
+    def checked_get_segment_stats(process_uuid):
+        # Raises if called on the event loop thread
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        return get_segment_stats(process_uuid)
+
+    monkeypatch.setattr(processor, "get_segment_stats", checked_get_segment_stats)
+
+    assert client.get(f"/segment/{file_process['process_uuid']}").status_code == 200
@@ -12,7 +12,7 @@ def generate_test_file(num_records=1000, output_path='data/raw/test_data.csv'):
         'id': range(num_records),
         'value': np.random.randint(1, 1000, num_records),
         'category': np.random.choice(['A', 'B', 'C'], num_records),
-        'timestamp': pd.date_range(start='2023-01-01', periods=num_records, freq='H')
+        'timestamp': pd.date_range(start='2023-01-01', periods=num_records, freq=pd.Timedelta(hours=1))
     }
     
     # Create DataFrame
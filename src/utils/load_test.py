@@ -0,0 +1,277 @@
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+from sqlalchemy import create_engine, delete, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+PATHS = {
+    "blocking": "/load-test/blocking/segment/{}",
+    "threadpool": "/segment/{}",
+}
+
+
+def create_app():
+    """
+    uvicorn factory serving src.web_app plus a baseline of the segment stats
+    route that runs the sync session on the event loop, on an engine sized
+    like the read pool.
+    """
+    from src import web_app
+    from src.database.database import DATABASE_URL, _engine_options
+    from src.database.models import FileProcess, Segment
+
+    engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
+    Session = sessionmaker(bind=engine)
+
+    def segment_stats(process_uuid):
+        with Session() as session:
+            file_process = session.scalar(
+                select(FileProcess).where(FileProcess.process_uuid == process_uuid)
+            )
+            segments = session.scalars(
+                select(Segment)
+                .where(Segment.file_process_id == file_process.id)
+                .order_by(Segment.segment_number)
+            )
+            return {
+                "process_uuid": file_process.process_uuid,
+                "total_records": file_process.total_records,
+                "segments": [{
+                    "segment_uuid": seg.segment_uuid,
+                    "segment_number": seg.segment_number,
+                    "record_count": seg.record_count
+                } for seg in segments]
+            }
+
+    @web_app.app.get(PATHS["blocking"].format("{process_uuid}"))
+    async def blocking_segment_stats(process_uuid: str):
+        # Sync session called on the event loop
+        return segment_stats(process_uuid)
+
+    return web_app.app
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_latency_proxy(listen_port, target_host, target_port, one_way_delay):
+    """Forward TCP traffic to Postgres, delaying each direction to simulate network latency."""
+
+    async def pipe(reader, writer):
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+
+        async def send():
+            while True:
+                due, data = await queue.get()
+                wait = due - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                if not data:
+                    writer.close()
+                    return
+                writer.write(data)
+                await writer.drain()
+
+        sender = asyncio.create_task(send())
+        try:
+            while True:
+                data = await reader.read(65536)
+                queue.put_nowait((loop.time() + one_way_delay, data))
+                if not data:
+                    break
+            await sender
+        except ConnectionError:
+            sender.cancel()
+            writer.close()
+
+    async def handle(client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection(target_host, target_port)
+        await asyncio.gather(
+            pipe(client_reader, server_writer),
+            pipe(server_reader, client_writer),
+            return_exceptions=True
+        )
+
+    async def serve():
+        server = await asyncio.start_server(handle, "127.0.0.1", listen_port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(serve())
+
+
+def seed(database_url, num_records):
+    """Process a generated file and return its process uuid."""
+    from src.database.database import DatabaseHandler
+    from src.database.models import init_db
+    from src.segmentation.core import SegmentationProcessor
+    from src.utils.generate_test_data import generate_test_file
+
+    db_handler = DatabaseHandler(database_url)
+    try:
+        init_db(db_handler.engine)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test_file = generate_test_file(num_records, os.path.join(tmp_dir, 'load_test.csv'))
+            return SegmentationProcessor(db_handler).process_file(test_file, 10)["process_uuid"]
+    finally:
+        db_handler.dispose()
+
+
+def cleanup(database_url, process_uuid):
+    """Delete the rows created by `seed`."""
+    from src.database.database import DatabaseHandler
+    from src.database.models import Donor, FileProcess, Record, Segment
+
+    db_handler = DatabaseHandler(database_url)
+    try:
+        with db_handler.session_scope() as session:
+            file_process = session.scalar(
+                select(FileProcess).where(FileProcess.process_uuid == process_uuid)
+            )
+            segment_ids = select(Segment.id).where(Segment.file_process_id == file_process.id)
+            record_ids = select(Record.id).where(Record.segment_id.in_(segment_ids))
+            session.execute(delete(Donor).where(Donor.record_id.in_(record_ids)))
+            session.execute(delete(Record).where(Record.segment_id.in_(segment_ids)))
+            session.execute(delete(Segment).where(Segment.file_process_id == file_process.id))
+            session.execute(delete(FileProcess).where(FileProcess.id == file_process.id))
+    finally:
+        db_handler.dispose()
+
+
+async def run_load(client, path, num_requests, rate):
+    """
+    Send requests open-loop at a fixed rate and return latencies in ms measured
+    from each request's scheduled send time, plus the number of failed requests.
+    """
+    latencies = []
+    errors = 0
+
+    async def timed(scheduled):
+        nonlocal errors
+        try:
+            response = await client.get(path)
+            response.raise_for_status()
+        except httpx.HTTPError:
+            errors += 1
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(num_requests):
+        scheduled = start + i / rate
+        wait = scheduled - time.perf_counter()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        tasks.append(asyncio.create_task(timed(scheduled)))
+    await asyncio.gather(*tasks)
+    return latencies, errors
+
+
+def summarize(label, latencies, errors):
+    p50, p99 = np.percentile(latencies, [50, 99])
+    print(f"{label:<10} p50={p50:8.2f}ms  p99={p99:8.2f}ms  max={max(latencies):8.2f}ms  errors={errors}")
+    return p99
+
+
+async def drive(base_url, process_uuid, num_requests, rate, rounds):
+    results = {label: ([], 0) for label in PATHS}
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        # Warm the pools, then alternate rounds so drift affects every path equally
+        for path in PATHS.values():
+            await run_load(client, path.format(process_uuid), 50, rate)
+        for _ in range(rounds):
+            for label, path in PATHS.items():
+                latencies, errors = await run_load(client, path.format(process_uuid), num_requests, rate)
+                results[label] = (results[label][0] + latencies, results[label][1] + errors)
+    return results
+
+
+def wait_until_ready(base_url, server, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited during startup")
+        try:
+            if httpx.get(base_url + "/").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("uvicorn did not start in time")
+
+
+def main(database_url, latency_ms, num_records, num_requests, rate, rounds):
+    url = make_url(database_url)
+    proxy_port, app_port = _free_port(), _free_port()
+    proxy_url = url.set(host="127.0.0.1", port=proxy_port).render_as_string(hide_password=False)
+    base_url = f"http://127.0.0.1:{app_port}"
+
+    process_uuid = seed(database_url, num_records)
+    proxy = multiprocessing.Process(
+        target=run_latency_proxy,
+        args=(proxy_port, url.host or "localhost", url.port or 5432, latency_ms / 2000),
+        daemon=True
+    )
+    proxy.start()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.utils.load_test:create_app", "--factory",
+         "--host", "127.0.0.1", "--port", str(app_port), "--workers", "1",
+         "--no-access-log", "--log-level", "warning"],
+        cwd=Path(__file__).resolve().parents[2],
+        env={**os.environ, "DATABASE_URL": proxy_url}
+    )
+    try:
+        wait_until_ready(base_url, server)
+        results = asyncio.run(drive(base_url, process_uuid, num_requests, rate, rounds))
+    finally:
+        server.terminate()
+        server.wait()
+        proxy.terminate()
+        cleanup(database_url, process_uuid)
+
+    print(f"{rounds * num_requests} requests per path at {rate}/s, {latency_ms}ms round trip to Postgres")
+    p99 = {label: summarize(label, *results[label]) for label in PATHS}
+    print(f"p99 blocking/threadpool: {p99['blocking'] / p99['threadpool']:.2f}x")
+
+
+if __name__ == '__main__':
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(
+        description="Compare read endpoint latency with the sync session on the event loop "
+                    "and in FastAPI's threadpool."
+    )
+    parser.add_argument('--database-url', required=True, help="Postgres database to seed and query")
+    parser.add_argument('--allow-postgres', action='store_true',
+                        help="allow seeding load test rows into the Postgres database")
+    parser.add_argument('--latency-ms', type=float, default=2.0,
+                        help="simulated round trip between app and Postgres")
+    parser.add_argument('--records', type=int, default=1000)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--rate', type=float, default=100.0, help="requests per second")
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    database_url = args.database_url.replace('postgres://', 'postgresql://', 1)
+    if make_url(database_url).get_backend_name() != 'postgresql':
+        parser.error("the load test needs a Postgres database")
+    if not args.allow_postgres:
+        parser.error("writing load test rows to Postgres requires --allow-postgres")
+    main(database_url, args.latency_ms, args.records, args.requests, args.rate, args.rounds)
@@ -2,13 +2,18 @@ from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 import uvicorn
 from database.database import DatabaseHandler
 from segmentation.core import SegmentationProcessor
 import tempfile
 import os
 
-app = FastAPI()
+# Initialize database handler
+db_handler = DatabaseHandler()
+processor = SegmentationProcessor(db_handler)
+
+app = FastAPI(lifespan=db_handler.lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -19,10 +24,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize database handler
-db_handler = DatabaseHandler()
-processor = SegmentationProcessor(db_handler)
-
 @app.get("/")
 async def root():
     return {"status": "ok", "message": "File Segmentation Service"}
@@ -39,8 +40,8 @@ async def process_file(
             temp_file.write(content)
             temp_filepath = temp_file.name
 
-        # Process file
-        result = processor.process_file(temp_filepath, num_segments)
+        # Process file in the threadpool so the event loop stays free
+        result = await run_in_threadpool(processor.process_file, temp_filepath, num_segments)
         
         # Clean up
         os.unlink(temp_filepath)
@@ -50,7 +51,7 @@ async def process_file(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/segments/{process_id}")
-async def get_segments(process_id: str):
+def get_segments(process_id: str):
     try:
         return processor.get_segment_stats(process_id)
     except Exception as e:
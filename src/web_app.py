@@ -2,6 +2,7 @@ from fastapi import FastAPI, UploadFile, File, HTTPException, Form
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 import uvicorn
 import os
 import json
@@ -18,8 +19,20 @@ from src.database.models import init_db
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Initialize database and processor
+try:
+    db_handler = DatabaseHandler()
+    init_db(db_handler.engine)
+    logger.info("Database tables created successfully")
+    
+    processor = SegmentationProcessor(db_handler)
+    logger.info("Database and processor initialized successfully")
+except Exception as e:
+    logger.error(f"Error initializing database: {str(e)}")
+    raise
+
 # Initialize FastAPI app
-app = FastAPI(title="File Segmentation Service")
+app = FastAPI(title="File Segmentation Service", lifespan=db_handler.lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -34,18 +47,6 @@ app.add_middleware(
 static_path = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
-# Initialize database and processor
-try:
-    db_handler = DatabaseHandler()
-    init_db(db_handler.engine)
-    logger.info("Database tables created successfully")
-    
-    processor = SegmentationProcessor(db_handler)
-    logger.info("Database and processor initialized successfully")
-except Exception as e:
-    logger.error(f"Error initializing database: {str(e)}")
-    raise
-
 @app.get("/", response_class=HTMLResponse)
 async def read_root():
     """Serve the main HTML page."""
@@ -123,15 +124,19 @@ async def process_file(
             temp_path = temp_file.name
             
         try:
-            # Process the file based on segmentation method
+            # Process the file based on segmentation method. Processing uses
+            # the sync engine, so run it in the threadpool to keep the event
+            # loop free for the read endpoints.
             if segmentation_method == 'equal':
-                result = processor.process_file(
+                result = await run_in_threadpool(
+                    processor.process_file,
                     temp_path,
                     num_segments,
                     selected_columns=selected_columns
                 )
             else:  # column-based
-                result = processor.process_file_by_column(
+                result = await run_in_threadpool(
+                    processor.process_file_by_column,
                     temp_path,
                     segment_column,
                     selected_columns=selected_columns
@@ -148,7 +153,7 @@ async def process_file(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/segment/{process_uuid}")
-async def get_segment_stats(process_uuid: str):
+def get_segment_stats(process_uuid: str):
     """Get statistics for all segments in a file process."""
     try:
         stats = processor.get_segment_stats(process_uuid)
@@ -160,7 +165,7 @@ async def get_segment_stats(process_uuid: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/segment/{segment_uuid}/records")
-async def get_segment_records(
+def get_segment_records(
     segment_uuid: str,
     page: int = 1,
     per_page: int = 100